@@ -11,7 +11,8 @@ Apps inherit from AppBase and override lifecycle methods.
 The framework calls these methods at the right times:
 
 1. on_view()  - Called when app starts. Draw your UI here.
-2. on_run()   - Async background task. Runs continuously while app is active.
+2. on_run()   - Optional async background task. Only override it if your
+                app has periodic work to do; this app doesn't.
 3. on_exit()  - Called when app stops. Clean up resources here.
 
 KEYBOARD INPUT:
@@ -41,8 +42,6 @@ Apps are organized hierarchically:
 Standalone mode: Run directly with `uv run poe run apps/hello_world.py`
 """
 
-import asyncio
-
 # =============================================================================
 # PATH SETUP FOR STANDALONE MODE
 # =============================================================================
@@ -123,37 +122,24 @@ class HelloWorld(AppBase):
         Lcd.setCursor(10, 125)
         Lcd.print("ESC = back")
 
-    async def on_run(self):
-        """
-        Async background task.
-
-        Called after on_view(). Runs continuously while the app is active.
-        Use this for:
-        - Periodic updates (animations, sensor readings, clocks)
-        - Background processing
-        - Waiting for events
-
-        IMPORTANT:
-        ----------
-        - This is an async function - use 'await' for delays!
-        - Use 'await asyncio.sleep_ms(n)' instead of 'time.sleep()'
-        - If you don't need background work, just idle with a sleep loop
-        - When the app exits, this task is automatically cancelled
-
-        EXAMPLE WITH UPDATES:
-        ---------------------
-        async def on_run(self):
-            counter = 0
-            while True:
-                counter += 1
-                Lcd.setCursor(10, 80)
-                Lcd.print(f"Count: {counter}")
-                await asyncio.sleep_ms(1000)  # Update every second
-        """
-        # This app has no background work, so just idle
-        # The sleep prevents busy-waiting and allows other tasks to run
-        while True:
-            await asyncio.sleep_ms(100)
+    # BACKGROUND WORK (on_run):
+    # -------------------------
+    # This app has no background work, so it doesn't override on_run().
+    # The framework then starts no task for it at all - nothing wakes up
+    # while the app sits idle. Don't add an idle sleep loop "just in case".
+    #
+    # If your app needs periodic updates (animations, sensor readings,
+    # clocks), override on_run() as an async method. It runs after
+    # on_view() and is cancelled automatically when the app exits.
+    # Use 'await asyncio.sleep_ms(n)' for delays, never time.sleep():
+    #
+    #     async def on_run(self):
+    #         counter = 0
+    #         while True:
+    #             counter += 1
+    #             Lcd.setCursor(10, 80)
+    #             Lcd.print(f"Count: {counter}")
+    #             await asyncio.sleep_ms(1000)  # Update every second
 
 
 if __name__ == "__main__":
@@ -410,14 +410,5 @@ class LauncherApp(AppBase):
         # Redraw menu
         self._draw_menu()
 
-    async def on_run(self):
-        """
-        Background task - the launcher just idles.
-
-        The launcher doesn't need to do anything in the background.
-        All interaction happens through _kb_event_handler().
-        """
-        import asyncio
-
-        while True:
-            await asyncio.sleep_ms(100)
+    # No on_run(): the launcher has no background work - all interaction
+    # happens through _kb_event_handler() - so no idle task is started.
@@ -26,6 +26,23 @@ echo ""
 # Remove local __pycache__ directories before copying
 find lib apps -type d -name "__pycache__" -exec rm -rf {} + 2>/dev/null || true
 
+# Optional: precompile lib/ and apps/ to .mpy bytecode (MPY=1 ./deploy.sh)
+# The device then skips parsing/compiling these files on every import.
+# main.py and boot.py stay as source - MicroPython only runs them by name.
+SRC_DIR="."
+if [ "${MPY:-0}" = "1" ]; then
+    SRC_DIR="build/mpy"
+    echo "Compiling lib/ and apps/ to .mpy in $SRC_DIR"
+    rm -rf "$SRC_DIR"
+    mkdir -p "$SRC_DIR"
+    cp -r lib apps "$SRC_DIR"/
+    find "$SRC_DIR/lib" "$SRC_DIR/apps" -name "*.py" | while read -r py; do
+        uv run mpy-cross "$py" -o "${py%.py}.mpy"
+        rm "$py"
+    done
+    echo ""
+fi
+
 # Python code for cleanup (remove old directories, cp -r will recreate them)
 CLEANUP_CODE='import os
 def rmtree(p):
@@ -43,8 +60,8 @@ rmtree("/flash/apps");print("Cleared /flash/apps")'
 # Note: cp -r lib/ :/flash/ copies lib directory to /flash/lib/
 uv run mpremote connect "$DEVICE" \
     exec "$CLEANUP_CODE" \
-    + fs cp -r lib/ :/flash/ \
-    + fs cp -r apps/ :/flash/ \
+    + fs cp -r "$SRC_DIR/lib/" :/flash/ \
+    + fs cp -r "$SRC_DIR/apps/" :/flash/ \
     + fs cp main.py :/flash/main.py \
     + fs cp boot.py :/flash/boot.py \
     + fs tree /flash
@@ -16,7 +16,7 @@ CONCEPTS COVERED:
 HOW THIS FILE WORKS:
 --------------------
 1. Initialize hardware (LCD, keyboard)
-2. Load app classes from APP_REGISTRY
+2. Read the app list from APP_REGISTRY (apps are imported on first launch)
 3. Draw a scrollable menu
 4. Wait for keyboard input
 5. When user selects an app, instantiate and run it
@@ -51,12 +51,16 @@ is awkward for quick navigation. ; and . are on the home row and easy to hit.
 # Standard library imports first, then third-party/hardware imports.
 # This is Python convention (PEP 8) for code organization.
 
+import asyncio  # Cooperative multitasking (tasks, events)
+import gc  # Garbage collector control
+import os  # File system operations
 import sys  # For sys.path manipulation (where Python looks for modules)
-import time  # For sleep/delays
+import time  # For sleep/delays and millisecond timestamps
 
 import M5  # M5Stack hardware abstraction layer
 import machine  # MicroPython hardware access (I2C, GPIO pins, etc.)
 from M5 import Lcd, Widgets  # LCD drawing and widget fonts
+from micropython import const  # Compile-time constants (see MENU LAYOUT)
 
 # =============================================================================
 # PATH SETUP - Where Python Looks for Modules
@@ -78,16 +82,9 @@ from M5 import Lcd, Widgets  # LCD drawing and widget fonts
 #    - Apps are at /flash/apps/
 #    - Device runs independently, no computer needed
 #
-# We add BOTH paths. Python will find modules from whichever exists.
-# /remote/apps is added LAST so it takes priority (first match wins in Python).
-
-for apps_path in ["/flash/legacy/apps", "/remote/legacy/apps"]:
-    if apps_path not in sys.path:
-        sys.path.insert(0, apps_path)  # insert(0, ...) = add to front of list
-
-# Detect which mode we're running in (for display purposes)
-import os  # File system operations
-
+# We check which mode we're in first, then add only that mode's apps
+# directory. Every import searches sys.path in order, so a path that
+# doesn't exist would just be one more failed lookup per import.
 try:
     # os.stat() gets file info. If file doesn't exist, raises OSError.
     os.stat("/remote/legacy/main.py")
@@ -95,6 +92,11 @@ try:
 except OSError:
     RUN_MODE = "flash"  # Running from device flash
 
+_apps_path = "/remote/legacy/apps" if RUN_MODE == "remote" else "/flash/legacy/apps"
+if _apps_path not in sys.path:
+    sys.path.insert(0, _apps_path)  # insert(0, ...) = add to front of list
+del _apps_path
+
 # =============================================================================
 # HARDWARE INITIALIZATION
 # =============================================================================
@@ -186,11 +188,29 @@ APP_REGISTRY = [
 ]
 
 
-def load_apps():
-    """
-    Dynamically import and instantiate app classes from APP_REGISTRY.
+# STRUCTURE OF ARRAYS
+# -------------------
+# APP_REGISTRY is a list of (module, class, display) tuples - easy to
+# read and edit. At runtime we split it into three parallel tuples so
+# the menu and launch code index one tuple directly (_DISPLAY[idx])
+# instead of fetching and unpacking a 3-tuple every time.
+_MODNAMES, _CLSNAMES, _DISPLAY = zip(*APP_REGISTRY)
+N_APPS = len(APP_REGISTRY)  # Counted once; the list never changes at runtime
+
+# The exact text of each menu row, selected ("> name") and not ("  name"),
+# built once here. Drawing a row just picks one - no string is created
+# while navigating, so there's less garbage for the GC to collect.
+_SEL_LINES = tuple("> " + name for name in _DISPLAY)
+_UNSEL_LINES = tuple("  " + name for name in _DISPLAY)
+
+# Resolved app class for each APP_REGISTRY index (None = not loaded yet).
+# Only used in flash mode.
+_app_classes = [None] * N_APPS
 
-    Returns a list of (display_name, app_class) tuples.
+
+def get_app_class(idx):
+    """
+    Import the module for APP_REGISTRY[idx] and return its app class.
 
     WHY DYNAMIC LOADING?
     --------------------
@@ -204,29 +224,34 @@ def load_apps():
     Deleting a module from this cache forces Python to re-read the file
     on next import. This is useful during development - edit your app,
     and changes take effect on next launch without rebooting the device.
+
+    In flash mode the files can't change while we're running, so we skip
+    the trick and keep the resolved class in _app_classes. Launching
+    the same app again is then just a list index instead of re-reading
+    and compiling the file.
     """
-    apps = []
-    for module_name, class_name, display_name in APP_REGISTRY:
+    module_name = _MODNAMES[idx]
+    if RUN_MODE == "remote":
         # Force reimport for development (allows reloading after code changes)
         if module_name in sys.modules:
             del sys.modules[module_name]
-        try:
-            # __import__ is the function behind the `import` statement
-            module = __import__(module_name)
-            # getattr gets an attribute by name - here, the class
-            app_class = getattr(module, class_name)
-            apps.append((display_name, app_class))
-        except ImportError as e:
-            # Module file not found or has syntax errors
-            print(f"Warning: Could not load {module_name}: {e}")
-        except AttributeError as e:
-            # Module loaded but class not found in it
-            print(f"Warning: {module_name} has no class {class_name}: {e}")
-    return apps
-
-
-# Load all apps at startup
-apps = load_apps()
+    else:
+        app_class = _app_classes[idx]
+        if app_class is not None:
+            return app_class
+
+    # __import__ is the function behind the `import` statement
+    module = __import__(module_name)
+    # getattr gets an attribute by name - here, the class
+    app_class = getattr(module, _CLSNAMES[idx])
+    if RUN_MODE != "remote":
+        _app_classes[idx] = app_class  # Remote mode always re-imports
+    return app_class
+
+
+# Nothing is imported at startup. Each app module is imported the first
+# time it's launched (see launch()), so boot doesn't pay for compiling
+# apps that are never opened, and a broken app only fails when selected.
 
 # =============================================================================
 # MENU STATE - Variables That Track Current Menu State
@@ -236,16 +261,92 @@ apps = load_apps()
 
 selected = 0  # Index of currently highlighted menu item
 scroll_offset = 0  # First visible item index (for scrolling)
-launch_app = None  # Set to an app instance when user selects one
+launch_app_idx = None  # Set to an APP_REGISTRY index when user selects one
+
+# Net ; / . presses not yet applied to selected (see _apply_nav())
+_nav_delta = 0
+
+# Set together with launch_app_idx. The main loop waits on this event, so
+# it sleeps until there's actually an app to launch instead of checking
+# a flag every few milliseconds.
+_launch_event = asyncio.Event()
 
 # MENU LAYOUT CONSTANTS
 # ---------------------
 # These define the visual layout of the menu.
 # Changing these adjusts how many items are visible and where they appear.
+#
+# const() tells the MicroPython compiler the value never changes. For
+# names starting with _ it goes further: every use is replaced by the
+# number itself when the file is compiled, so there's no global lookup
+# at runtime and expressions like _MENU_START_Y + 3 * _MENU_ITEM_H are
+# worked out ahead of time.
+
+_MENU_START_Y = const(22)  # Y position where menu items start (below title)
+_MENU_ITEM_H = const(22)  # Height of each menu item in pixels
+_VISIBLE_ITEMS = const(4)  # How many items fit on screen at once
+
+# Y coordinate of each visible row slot, computed once
+_ROW_Y = tuple(_MENU_START_Y + i * _MENU_ITEM_H for i in range(_VISIBLE_ITEMS))
+# Y coordinate of the "v" (more items below) arrow, beside the last row
+DOWN_ARROW_Y = _MENU_START_Y + (_VISIBLE_ITEMS - 1) * _MENU_ITEM_H + 10
+
+# DIRTY MASK
+# ----------
+# One bit per visible row slot: bit i set = row i must be redrawn. The
+# bit just above the rows stands for the ^/v scroll indicator column.
+# The navigation handlers only set bits instead of drawing right away;
+# flush_dirty() repaints the marked parts once after each batch of key
+# events (see poll_hardware()), so holding or rapidly tapping ; or .
+# paints only the final position.
+_INDICATOR_BIT = const(1 << _VISIBLE_ITEMS)
+_ALL_DIRTY = const((_INDICATOR_BIT << 1) - 1)  # Every row + indicator column
+_dirty_mask = 0
+
+# ROW SPRITE (OFF-SCREEN CANVAS)
+# ------------------------------
+# Drawing a row straight to the LCD is three separate SPI transfers
+# (clear rect, then text). Instead we draw the row into a small
+# off-screen canvas in RAM and push it in one go - one contiguous
+# transfer and no flicker between the clear and the text.
+# 220x22 pixels at 16 bits = ~10KB. If the firmware has no canvas
+# support (or not enough RAM), we fall back to drawing directly.
+try:
+    _row_sprite = Lcd.newCanvas(220, _MENU_ITEM_H)
+    _row_sprite.setFont(Widgets.FONTS.ASCII7)
+    _row_sprite.setTextSize(2)
+    _row_sprite.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
+except (AttributeError, MemoryError):
+    _row_sprite = None
+
+
+def _make_label_sprite(text, color):
+    """
+    Pre-render a fixed line of size-1 text into a canvas.
+
+    The run mode badge and key hint never change after boot, so we draw
+    them once here and just push the finished pixels on each full redraw.
+    Returns None if canvases aren't available (caller draws directly).
+    """
+    try:
+        sprite = Lcd.newCanvas(len(text) * 6, 10)
+    except (AttributeError, MemoryError):
+        return None
+    sprite.fillScreen(Lcd.COLOR.BLACK)
+    sprite.setFont(Widgets.FONTS.ASCII7)
+    sprite.setTextSize(1)
+    sprite.setTextColor(color, Lcd.COLOR.BLACK)
+    sprite.setCursor(0, 0)
+    sprite.print(text)
+    return sprite
 
-MENU_START_Y = 22  # Y position where menu items start (below title)
-MENU_ITEM_H = 22  # Height of each menu item in pixels
-VISIBLE_ITEMS = 4  # How many items fit on screen at once
+
+# Run mode indicator colour (remote=cyan for development, flash=green)
+MODE_COLOR = Lcd.COLOR.CYAN if RUN_MODE == "remote" else Lcd.COLOR.GREEN
+KEY_HINT = "Enter=Select  ;/.=Nav"
+
+_mode_sprite = _make_label_sprite(RUN_MODE, MODE_COLOR)
+_hint_sprite = _make_label_sprite(KEY_HINT, Lcd.COLOR.WHITE)
 
 
 # =============================================================================
@@ -253,9 +354,23 @@ VISIBLE_ITEMS = 4  # How many items fit on screen at once
 # =============================================================================
 
 
-def draw_menu():
+# SPI TRANSACTIONS
+# ----------------
+# Every drawing call normally claims the LCD's SPI bus, sends its
+# pixels and releases it again. Between startWrite() and endWrite() the
+# bus stays claimed, so a whole redraw goes out as one transaction.
+# Not every firmware build exposes these, so fall back to doing nothing.
+def _no_op():
+    pass
+
+
+_start_write = getattr(Lcd, "startWrite", _no_op)
+_end_write = getattr(Lcd, "endWrite", _no_op)
+
+
+def _update_scroll():
     """
-    Draw the menu on screen.
+    Adjust scroll_offset so the selected item is visible.
 
     SCROLLING LOGIC:
     ----------------
@@ -269,18 +384,110 @@ def draw_menu():
 
     We adjust scroll_offset to keep the selected item visible:
     - If selected < scroll_offset: scroll up
-    - If selected >= scroll_offset + VISIBLE_ITEMS: scroll down
+    - If selected >= scroll_offset + _VISIBLE_ITEMS: scroll down
+
+    Returns True if scroll_offset changed (the whole list must be redrawn).
     """
     global scroll_offset
 
-    # Keep selection visible by adjusting scroll
+    old_offset = scroll_offset
     if selected < scroll_offset:
         scroll_offset = selected
-    elif selected >= scroll_offset + VISIBLE_ITEMS:
-        scroll_offset = selected - VISIBLE_ITEMS + 1
+    elif selected >= scroll_offset + _VISIBLE_ITEMS:
+        scroll_offset = selected - _VISIBLE_ITEMS + 1
+    return scroll_offset != old_offset
+
+
+def _mark_item(idx):
+    """Mark the row showing APP_REGISTRY[idx] dirty, if it's on screen."""
+    global _dirty_mask
+
+    i = idx - scroll_offset
+    if 0 <= i < _VISIBLE_ITEMS:
+        _dirty_mask |= 1 << i
+
+
+def _draw_row(i):
+    """
+    Draw one visible menu row (i = 0.._VISIBLE_ITEMS-1).
+
+    Without the row sprite, expects text size 2 / white already set.
+    """
+    idx = scroll_offset + i  # Actual index in APP_REGISTRY
+    # ">" prefix on the selected item for visual indicator; None = no item
+    text = (_SEL_LINES[idx] if idx == selected else _UNSEL_LINES[idx]) if idx < N_APPS else None
+
+    # Only this row's rectangle is redrawn, the rest of the screen is kept
+    y = _ROW_Y[i]
+    if _row_sprite:
+        _row_sprite.fillScreen(Lcd.COLOR.BLACK)
+        if text:
+            _row_sprite.setCursor(10, 0)
+            _row_sprite.print(text)
+        _row_sprite.push(0, y)
+        return
+
+    Lcd.fillRect(0, y, 220, _MENU_ITEM_H, Lcd.COLOR.BLACK)
+    if text:
+        Lcd.setCursor(10, y)
+        Lcd.print(text)
+
+
+def _draw_scroll_indicators():
+    """Draw ^ / v in the right-hand column if items are off screen."""
+    Lcd.setTextSize(1)
+    Lcd.fillRect(220, _MENU_START_Y, 20, _VISIBLE_ITEMS * _MENU_ITEM_H, Lcd.COLOR.BLACK)
+    if scroll_offset > 0:
+        Lcd.setCursor(225, _MENU_START_Y)
+        Lcd.print("^")  # Items above
+    if scroll_offset + _VISIBLE_ITEMS < N_APPS:
+        Lcd.setCursor(225, DOWN_ARROW_Y)
+        Lcd.print("v")  # Items below
+
+
+def draw_menu_full():
+    """
+    Draw the whole menu screen.
+
+    Used at startup and after returning from an app, when the screen
+    contents are unknown. Navigation uses flush_dirty() instead.
+    The drawing itself is in _draw_menu_full(), wrapped here in one
+    SPI transaction.
+    """
+    _start_write()
+    try:
+        _draw_menu_full()
+    finally:
+        _end_write()  # Always release the bus, even if drawing failed
+
+
+def _draw_menu_full():
+    global _dirty_mask
+
+    _update_scroll()
+    _dirty_mask = 0  # Everything is about to be drawn
 
     # Clear screen and draw title
     Lcd.fillScreen(Lcd.COLOR.BLACK)
+    _draw_header()
+
+    # Reset text settings for menu items
+    Lcd.setTextSize(2)
+    Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
+
+    # Draw visible menu items
+    for i in range(_VISIBLE_ITEMS):
+        _draw_row(i)
+
+    # Draw scroll indicators if there are items above/below visible area
+    _draw_scroll_indicators()
+
+    # Draw key hint at bottom
+    _draw_hint()
+
+
+def _draw_header():
+    """Draw the title and run mode badge along the top of the screen."""
     Lcd.setFont(Widgets.FONTS.ASCII7)  # Monospace font, 6x9 pixels base size
     Lcd.setTextSize(2)  # 2x scale = 12x18 pixels per character
     Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
@@ -289,41 +496,117 @@ def draw_menu():
 
     # Show run mode indicator (remote=cyan, flash=green)
     # This helps you know if you're running mounted files or deployed files
-    Lcd.setTextSize(1)
-    if RUN_MODE == "remote":
-        Lcd.setTextColor(Lcd.COLOR.CYAN, Lcd.COLOR.BLACK)  # Cyan for remote/development
+    if _mode_sprite:
+        _mode_sprite.push(200, 5)
     else:
-        Lcd.setTextColor(Lcd.COLOR.GREEN, Lcd.COLOR.BLACK)  # Green for flash/standalone
-    Lcd.setCursor(200, 5)
-    Lcd.print(RUN_MODE)
+        Lcd.setTextSize(1)
+        Lcd.setTextColor(MODE_COLOR, Lcd.COLOR.BLACK)
+        Lcd.setCursor(200, 5)
+        Lcd.print(RUN_MODE)
 
-    # Reset text settings for menu items
-    Lcd.setTextSize(2)
-    Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
 
-    # Draw visible menu items
-    for i in range(VISIBLE_ITEMS):
-        idx = scroll_offset + i  # Actual index in apps list
-        if idx >= len(apps):
-            break  # No more items to draw
-        name, _ = apps[idx]
-        Lcd.setCursor(10, MENU_START_Y + i * MENU_ITEM_H)
-        # Add ">" prefix to selected item for visual indicator
-        prefix = "> " if idx == selected else "  "
-        Lcd.print(f"{prefix}{name}")
+def _draw_hint():
+    """Draw the key hint along the bottom of the screen."""
+    if _hint_sprite:
+        _hint_sprite.push(0, 125)
+    else:
+        Lcd.setTextSize(1)
+        Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
+        Lcd.setCursor(0, 125)
+        Lcd.print(KEY_HINT)
 
-    # Draw scroll indicators if there are items above/below visible area
-    Lcd.setTextSize(1)
-    if scroll_offset > 0:
-        Lcd.setCursor(225, MENU_START_Y)
-        Lcd.print("^")  # Items above
-    if scroll_offset + VISIBLE_ITEMS < len(apps):
-        Lcd.setCursor(225, MENU_START_Y + (VISIBLE_ITEMS - 1) * MENU_ITEM_H + 10)
-        Lcd.print("v")  # Items below
 
-    # Draw key hint at bottom
-    Lcd.setCursor(0, 125)
-    Lcd.print("Enter=Select  ;/.=Nav")
+def draw_menu_rect(x, y, w, h):
+    """
+    Repaint only the part of the menu inside the rectangle x, y, w, h.
+
+    PARTIAL RESTORE:
+    ----------------
+    An app that only drew in part of the screen can say so by setting
+    self.dirty_rect = (x, y, w, h) before run() returns. Everything
+    outside that rectangle still shows the menu, so instead of a full
+    fillScreen() we clear just the rectangle and redraw the pieces of
+    the menu (title, rows, ^/v column, key hint) that overlap it.
+
+    This is opt-in: the bundled legacy apps all clear the whole screen,
+    so none of them set dirty_rect and they get draw_menu_full().
+    """
+    global _dirty_mask
+
+    _start_write()
+    try:
+        # The app may have left any font set, and _draw_hint() (without
+        # its sprite) and the rows below don't set one themselves
+        Lcd.setFont(Widgets.FONTS.ASCII7)
+        Lcd.fillRect(x, y, w, h, Lcd.COLOR.BLACK)
+        bottom = y + h
+
+        if y < _MENU_START_Y:
+            _draw_header()
+        if bottom > 125:
+            _draw_hint()
+    finally:
+        _end_write()
+
+    # Mark the rows and ^/v column the rectangle wiped, then repaint them
+    _dirty_mask |= _rect_dirty_mask(x, y, w, h)
+    flush_dirty()
+
+
+def _rect_dirty_mask(x, y, w, h):
+    """
+    Return the _dirty_mask bits for the menu parts the rectangle overlaps.
+
+    Rows span x 0-220 and the ^/v column x 220-240, both over the menu
+    area from _MENU_START_Y down. Pure arithmetic, no drawing.
+    """
+    bottom = y + h
+    mask = 0
+    if x < 220:
+        for i in range(_VISIBLE_ITEMS):
+            row_y = _ROW_Y[i]
+            if y < row_y + _MENU_ITEM_H and row_y < bottom:
+                mask |= 1 << i
+    if x + w > 220 and y < _MENU_START_Y + _VISIBLE_ITEMS * _MENU_ITEM_H and bottom > _MENU_START_Y:
+        mask |= _INDICATOR_BIT
+    return mask
+
+
+def flush_dirty():
+    """
+    Redraw the parts of the menu marked in _dirty_mask, then clear it.
+
+    DIRTY-REGION DRAWING:
+    ---------------------
+    The LCD is driven over SPI, so every pixel we paint costs bus time.
+    A full fillScreen() pushes the whole 240x135 frame; moving the ">"
+    cursor only changes two rows. The navigation handlers mark just
+    the old and new row (or everything, if the list scrolled), and we
+    walk the set bits here, so only those rows are repainted. The
+    title, run mode badge and key hint never change, so they are left
+    untouched.
+    """
+    global _dirty_mask
+
+    mask = _dirty_mask
+    _dirty_mask = 0
+    _start_write()
+    try:
+        Lcd.setTextSize(2)
+        Lcd.setTextColor(Lcd.COLOR.WHITE, Lcd.COLOR.BLACK)
+
+        draw_row = _draw_row  # Local: looked up once, not per row
+        i = 0
+        while mask:
+            if mask & 1:
+                if i < _VISIBLE_ITEMS:
+                    draw_row(i)
+                else:
+                    _draw_scroll_indicators()
+            mask >>= 1
+            i += 1
+    finally:
+        _end_write()
 
 
 # =============================================================================
@@ -331,6 +614,76 @@ def draw_menu():
 # =============================================================================
 
 
+def _apply_nav():
+    """
+    Apply the net movement from a batch of ; and . presses.
+
+    Holding a nav key queues a run of events. Rather than moving (and
+    wrapping) once per event, the handlers just count up/down in
+    _nav_delta and the selection moves once by the total.
+
+    Marks the old and new rows dirty, or everything if the list
+    scrolled; poll_hardware() draws them after the batch.
+    """
+    global selected, _nav_delta, _dirty_mask
+
+    if _nav_delta:
+        _mark_item(selected)  # Old row loses its ">"
+        # Wrap past either end: top <-> bottom. Compare-and-add instead
+        # of %: usually the net move is +-1 and this is one comparison.
+        # A loop, not an if, because a long key run can exceed N_APPS.
+        selected += _nav_delta
+        while selected < 0:
+            selected += N_APPS
+        while selected >= N_APPS:
+            selected -= N_APPS
+        _nav_delta = 0
+        if _update_scroll():
+            _dirty_mask = _ALL_DIRTY
+        else:
+            _mark_item(selected)
+
+
+def _on_enter():
+    """Enter: remember the selected app for the main loop to launch."""
+    global launch_app_idx
+
+    _apply_nav()  # Launch what's selected *now*, including earlier nav keys
+    # Importing and creating the app is slow, so the main loop
+    # does it (see launch() below).
+    launch_app_idx = selected
+    _launch_event.set()
+
+
+def _on_up():
+    """Semicolon: move selection up (applied by _apply_nav)."""
+    global _nav_delta
+
+    _nav_delta -= 1
+
+
+def _on_down():
+    """Period: move selection down (applied by _apply_nav)."""
+    global _nav_delta
+
+    _nav_delta += 1
+
+
+# KEY DISPATCH TABLE
+# ------------------
+# Maps key codes to the function that handles them. One dict lookup
+# (done in C) replaces a chain of == comparisons per key event.
+# - 0x0D (13) or 0x0A (10) = Enter
+# - 59 = semicolon (;) - we use this for "up"
+# - 46 = period (.) - we use this for "down"
+_KEY_ACTIONS = {
+    0x0D: _on_enter,
+    0x0A: _on_enter,
+    59: _on_up,
+    46: _on_down,
+}
+
+
 def menu_key_handler(keyboard):
     """
     Handle keyboard events for menu navigation.
@@ -351,47 +704,27 @@ def menu_key_handler(keyboard):
     The callback runs in an interrupt context. Long operations here
     can cause timing issues. Instead, set flags and handle in main loop.
 
-    KEY CODES:
-    ----------
-    - 0x0D (13) or 0x0A (10) = Enter
-    - 0x1B (27) = Escape
-    - 59 = semicolon (;) - we use this for "up"
-    - 46 = period (.) - we use this for "down"
+    Each key code is looked up in _KEY_ACTIONS; keys not in the table
+    are ignored.
     """
-    global selected, launch_app
-
     # Process all pending key events
-    while keyboard._keyevents:
-        event = keyboard._keyevents.pop(0)  # Get and remove first event
+    # Take the whole batch at once: list.pop(0) shifts every remaining
+    # element, so draining one at a time is O(n^2) for a burst of keys.
+    events = keyboard._keyevents[:]
+    keyboard._keyevents.clear()
+    for event in events:
         key = event.keycode
 
         # Skip invalid/modifier-only events
         if key == 0 or key > 127:
             continue
 
-        if key == 0x0D or key == 0x0A:  # Enter key
-            # User selected an app - load it
-            # We reload the module here to pick up any code changes
-            module_name, class_name, _ = APP_REGISTRY[selected]
-            if module_name in sys.modules:
-                del sys.modules[module_name]  # Force reimport
-            try:
-                module = __import__(module_name)
-                app_class = getattr(module, class_name)
-                # Create app instance, passing keyboard so app can use it
-                launch_app = app_class(kb)
-            except Exception as e:
-                print(f"Error loading {module_name}: {e}")
-
-        elif key == 59:  # Semicolon = Up
-            # Move selection up, wrap around to bottom if at top
-            selected = (selected - 1) % len(apps)
-            draw_menu()
-
-        elif key == 46:  # Period = Down
-            # Move selection down, wrap around to top if at bottom
-            selected = (selected + 1) % len(apps)
-            draw_menu()
+        action = _KEY_ACTIONS.get(key)
+        if action:
+            action()
+
+    # Move once for the whole batch of nav keys
+    _apply_nav()
 
 
 # =============================================================================
@@ -401,35 +734,114 @@ def menu_key_handler(keyboard):
 # The pattern is:
 # 1. Register keyboard callback
 # 2. Draw initial UI
-# 3. Loop forever, calling M5.update() to process events
-# 4. Check for actions triggered by callbacks (like launch_app)
+# 3. A background task calls M5.update() to process events
+# 4. The main loop waits for actions triggered by callbacks (like
+#    launch_app_idx) and handles them
 
-# Register our keyboard handler
-kb.set_keyevent_callback(menu_key_handler)
 
-# Draw the initial menu
-draw_menu()
-print("Launcher ready")
+def launch(idx):
+    """
+    Load, create and run the app at APP_REGISTRY[idx].
 
-# Main event loop
-while True:
-    # M5.update() is REQUIRED - it processes hardware events
-    # This triggers keyboard callbacks, updates the screen, etc.
-    M5.update()
+    This runs from the main loop, not the keyboard callback, because
+    importing a module can take tens of milliseconds.
+    """
+    # In remote mode the module is reloaded to pick up code changes
+    try:
+        app_class = get_app_class(idx)
+        # Create app instance, passing keyboard so app can use it
+        app = app_class(kb)
+    except Exception as e:
+        print(f"Error loading {_MODNAMES[idx]}: {e}")
+        return
+
+    # Run the app - this blocks until app's run() returns
+    app.run()
+    # Optional: the area of the screen the app drew over (see draw_menu_rect)
+    rect = getattr(app, "dirty_rect", None)
+
+    # App exited - free whatever it left behind now, while nothing is
+    # animating, rather than letting the GC kick in mid-navigation
+    del app
+    gc.collect()
+
+    # Restore menu
+    # Re-register our keyboard handler (app may have changed it)
+    kb.set_keyevent_callback(menu_key_handler)
+    if rect is None:
+        draw_menu_full()  # Unknown screen contents - redraw everything
+    else:
+        draw_menu_rect(*rect)
 
-    # Check if user selected an app to launch
-    if launch_app:
-        app = launch_app
-        launch_app = None  # Clear so we don't re-launch
 
-        # Run the app - this blocks until app's run() returns
-        app.run()
+# IDLE POLLING:
+# -------------
+# M5.update() talks to the hardware (including the keyboard over I2C),
+# so calling it 100 times a second while nobody is typing wastes power.
+# The keyboard pulls intr_pin LOW while it has unread key events, and
+# reading a GPIO level is nearly free. So every 10ms we only check the
+# pin, and call M5.update() when it's asserted - plus every
+# HOUSEKEEPING_MS so everything else still gets serviced.
+#
+# Why not intr_pin.irq() or machine.lightsleep()? KeyboardI2C was given
+# intr_pin for its own interrupt handling, and a pin has only one IRQ
+# handler - ours could replace the driver's. lightsleep drops the USB
+# serial link that mpremote mount depends on.
+HOUSEKEEPING_MS = 100  # Max time between M5.update() calls when idle
+
+
+async def poll_hardware():
+    """
+    Background task: call M5.update() when there's input to process.
 
-        # App exited - restore menu
-        # Re-register our keyboard handler (app may have changed it)
-        kb.set_keyevent_callback(menu_key_handler)
-        draw_menu()
+    Keyboard callbacks (menu_key_handler) run from inside M5.update(),
+    so this task is what drives all menu input. Any navigation from
+    that batch of events is drawn once, right after.
+    """
+    last_update = time.ticks_ms()
+    while True:
+        now = time.ticks_ms()
+        if intr_pin.value() == 0 or time.ticks_diff(now, last_update) >= HOUSEKEEPING_MS:
+            # M5.update() is REQUIRED - it processes hardware events
+            # This triggers keyboard callbacks, updates the screen, etc.
+            M5.update()
+            last_update = now
+
+            if _dirty_mask:
+                flush_dirty()
+
+        # 10ms between pin checks keeps key latency the same as before.
+        # await (not time.sleep_ms) lets other tasks run meanwhile.
+        await asyncio.sleep_ms(10)
+
+
+async def main_loop():
+    """
+    Wait for the user to pick an app, then run it.
+
+    Between keystrokes this task is parked on _launch_event and costs
+    nothing - it only wakes when the Enter handler sets the event.
+    """
+    global launch_app_idx
+
+    asyncio.create_task(poll_hardware())
+    while True:
+        await _launch_event.wait()
+        _launch_event.clear()
+
+        idx = launch_app_idx
+        launch_app_idx = None  # Clear so we don't re-launch
+        # app.run() blocks the whole event loop until the app exits.
+        # That's fine: legacy apps run their own M5.update() loop.
+        launch(idx)
+
+
+# Register our keyboard handler
+kb.set_keyevent_callback(menu_key_handler)
+
+# Draw the initial menu
+draw_menu_full()
+print("Launcher ready")
 
-    # Small delay to prevent busy-waiting
-    # 10ms = 100 updates per second, plenty responsive
-    time.sleep_ms(10)
+# Start the event loop (runs forever)
+asyncio.run(main_loop())
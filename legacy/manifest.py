@@ -0,0 +1,25 @@
+# Freeze manifest for the legacy apps.
+#
+# FROZEN BYTECODE:
+# ----------------
+# Frozen modules are compiled by mpy-cross when the firmware is built
+# and run straight from flash, so importing them skips reading and
+# compiling the .py source on the device. Pull this file into a custom
+# firmware build from the board's manifest:
+#
+#     include("/path/to/cardputer-adv/legacy/manifest.py")
+#
+# The module names match APP_REGISTRY in legacy/main.py, so the
+# launcher's __import__() finds the frozen copies with no code change.
+# In remote mode the mounted directories come first in sys.path, so the
+# .py files you're editing still win over the frozen ones.
+
+module("hello_world.py", base_path="apps")
+module("notepad.py", base_path="apps")
+module("demo_anim.py", base_path="apps")
+module("demo_text.py", base_path="apps")
+module("demo_sound.py", base_path="apps")
+module("demo_keyboard.py", base_path="apps")
+module("demo_lcd.py", base_path="apps")
+module("demo_widgets.py", base_path="apps")
+module("demo_nvs.py", base_path="apps")
@@ -15,7 +15,7 @@ Apps go through these lifecycle stages, each with a corresponding method:
         ▼
     start()  ─────────► on_launch()     When app is about to become active
         │               on_view()       Draw your UI here
-        │               on_ready()      Starts the on_run() async task
+        │               on_ready()      Starts on_run() if the app overrides it
         │                   │
         │                   ▼
         │               on_run()        Async loop running in background
@@ -49,10 +49,12 @@ CREATING AN APP:
             Lcd.fillScreen(Lcd.COLOR.BLACK)
             Lcd.print("Hello!")
 
+        # Only override on_run() for periodic work - without it, no
+        # background task is started at all
         async def on_run(self):
-            # Background task (optional)
             while True:
-                await asyncio.sleep_ms(100)
+                update_clock()
+                await asyncio.sleep_ms(1000)
 """
 
 import asyncio
@@ -221,9 +223,18 @@ class AppBase:
         This creates an asyncio task that runs on_run().
         Usually you don't need to override this - just override on_run().
 
-        Default: Creates task running on_run().
+        Apps that don't override on_run() get no task at all, so idle
+        apps add nothing to the scheduler.
+
+        Calling this while the task is still running does nothing, so a
+        repeated start() or resume() never leaves two copies running.
+
+        Default: Creates task running on_run() if the app overrides it.
         """
-        self._task = asyncio.create_task(self.on_run())
+        if self._task is not None and not self._task.done():
+            return
+        if type(self).on_run is not AppBase.on_run:
+            self._task = asyncio.create_task(self.on_run())
 
     async def on_run(self):
         """
@@ -238,16 +249,12 @@ class AppBase:
         - This is an async function - use 'await'!
         - Use 'await asyncio.sleep_ms(n)' for delays
         - The task is cancelled when the app exits
-        - If you don't need background work, just idle:
+        - If you don't need background work, don't override this at all
+          (no task is started for the default)
 
-            async def on_run(self):
-                while True:
-                    await asyncio.sleep_ms(100)
-
-        Default: Sleeps forever (does nothing).
+        Default: Parks forever on an Event (never wakes, still cancellable).
         """
-        while True:
-            await asyncio.sleep_ms(500)
+        await asyncio.Event().wait()
 
     def on_hide(self):
         """
@@ -262,6 +269,31 @@ class AppBase:
             self._task.cancel()
             self._task = None
 
+    async def on_hide_async(self):
+        """
+        Awaitable version of on_hide().
+
+        Calls on_hide(), then waits until the cancelled on_run() task has
+        actually finished unwinding. Cancelling only schedules the task to
+        stop, so without this a quick restart can briefly leave the old
+        task running alongside the new one.
+
+        The task is cancelled here too, in case an on_hide() override
+        didn't call super().
+        """
+        task = self._task
+        self.on_hide()
+        self._task = None
+        if task is None or task is asyncio.current_task():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"[app] {self.name} on_run error: {e}")
+
     def on_exit(self):
         """
         Called when app is fully stopped.
@@ -330,6 +362,17 @@ class AppBase:
         self.on_hide()
         self.on_exit()
 
+    async def stop_async(self):
+        """
+        Fully stop the app and wait for on_run() to finish.
+
+        Same as stop(), but uses on_hide_async() so the background task
+        is gone before this returns. The framework uses this when
+        switching apps.
+        """
+        await self.on_hide_async()
+        self.on_exit()
+
     def uninstall(self):
         """Remove app from framework. Calls on_uninstall()."""
         self.on_uninstall()
@@ -276,9 +276,9 @@ class Framework:
                     # No manifest, skip this directory
                     pass
 
-            # Python file -> potential app
-            elif name.endswith(".py") and entry_type == 0x8000:
-                module_name = name[:-3]  # Remove .py
+            # Python file (source or precompiled .mpy) -> potential app
+            elif entry_type == 0x8000 and (name.endswith(".py") or name.endswith(".mpy")):
+                module_name = name[: name.rfind(".")]  # Remove .py / .mpy
 
                 # Skip launcher (never shown in menu)
                 if module_name == "launcher":
@@ -467,8 +467,8 @@ class Framework:
     # =========================================================================
 
     async def unload(self, app: app_base.AppBase):
-        """Stop an app (calls stop() which triggers on_hide + on_exit)."""
-        app.stop()
+        """Stop an app (calls stop_async() which triggers on_hide + on_exit)."""
+        await app.stop_async()
 
     async def load(self, app: app_base.AppBase):
         """Start an app (calls start() which triggers lifecycle methods)."""
@@ -476,7 +476,7 @@ class Framework:
 
     async def reload(self, app: app_base.AppBase):
         """Restart an app (stop then start)."""
-        app.stop()
+        await app.stop_async()
         app.start(self)
 
     async def launch_app(self, app: app_base.AppBase):
@@ -495,7 +495,7 @@ class Framework:
         current_name = getattr(current, "name", type(current).__name__)
         app_name = getattr(app, "name", type(app).__name__)
         print(f"[framework] Launching {app_name} (from {current_name})")
-        current.stop()
+        await current.stop_async()
         self._app_selector.select(app)
         app.start(self)
 
@@ -513,13 +513,13 @@ class Framework:
         # No launcher set - exit the framework (standalone mode)
         if not self._launcher:
             print(f"[framework] Exiting {current_name} (standalone mode)")
-            current.stop()
+            await current.stop_async()
             self._running = False
             return
 
         if current != self._launcher:
             print(f"[framework] Returning to launcher (from {current_name})")
-            current.stop()
+            await current.stop_async()
             self._app_selector.select(self._launcher)
             self._launcher.start(self)
 
@@ -572,31 +572,17 @@ class Framework:
                 event.key = kb.get_key()
                 event.status = False  # Reset handled status
 
-                # Route to current app
-                await self.handle_input(event)
+                # Route to current app. This is inlined rather than split
+                # into a helper coroutine so each keystroke only awaits the
+                # app's own handler.
+                handler = getattr(self._app_selector.current(), "_kb_event_handler", None)
+                if handler is not None:
+                    await handler(event, self)
+
+                # If not handled and ESC was pressed, return to launcher
+                if event.status is False and event.key == KeyCode.KEYCODE_ESC:
+                    await self.return_to_launcher()
 
             # Small delay to prevent busy-waiting
             # 10ms = 100 updates per second, very responsive
             await asyncio.sleep_ms(10)
-
-    async def handle_input(self, event: KeyEvent):
-        """
-        Handle a keyboard event.
-
-        Routes the event to the current app's _kb_event_handler.
-        If the event is not handled and is ESC, returns to launcher.
-
-        Parameters:
-        -----------
-        event : KeyEvent
-            The keyboard event to handle
-        """
-        app = self._app_selector.current()
-
-        # Let the app handle the event first
-        if hasattr(app, "_kb_event_handler"):
-            await app._kb_event_handler(event, self)
-
-        # If not handled and ESC was pressed, return to launcher
-        if event.status is False and event.key == KeyCode.KEYCODE_ESC:
-            await self.return_to_launcher()
@@ -11,17 +11,20 @@ SD_CS = 12
 SD_FREQ = 1000000
 
 _sd = None
+_pins = None  # (sck, miso, mosi, cs), created on first mount and reused
 
 
 def mount():
     """Mount SD card at /sd"""
-    global _sd
+    global _sd, _pins
+    if _pins is None:
+        _pins = (Pin(SD_SCK), Pin(SD_MISO), Pin(SD_MOSI), Pin(SD_CS))
     _sd = SDCard(
         slot=3,
-        sck=Pin(SD_SCK),
-        miso=Pin(SD_MISO),
-        mosi=Pin(SD_MOSI),
-        cs=Pin(SD_CS),
+        sck=_pins[0],
+        miso=_pins[1],
+        mosi=_pins[2],
+        cs=_pins[3],
         freq=SD_FREQ,
     )
     os.mount(_sd, "/sd")
@@ -43,15 +43,22 @@ CONTROLS:
 import os
 import sys
 
+
+def _add_paths(paths):
+    """Insert paths at the front of sys.path, skipping ones already there."""
+    known = set(sys.path)
+    for path in paths:
+        if path not in known:
+            sys.path.insert(0, path)
+            known.add(path)
+
+
 # Detect run mode and configure paths
 try:
     os.stat("/remote/apps")
     # Dev mode: mounted at /remote
     # Insert at position 0 so /remote is searched BEFORE /flash
-    if "/remote/lib" not in sys.path:
-        sys.path.insert(0, "/remote/lib")
-    if "/remote/apps" not in sys.path:
-        sys.path.insert(0, "/remote/apps")
+    _add_paths(("/remote/lib", "/remote/apps"))
     # Clear any cached modules from /flash so we load fresh from /remote
     for mod_name in list(sys.modules.keys()):
         mod = sys.modules[mod_name]
@@ -60,10 +67,7 @@ try:
 except OSError:
     # Deployed mode: add /flash/lib and /flash/apps to path
     # Note: default sys.path may have /flash/libs (with 's'), not /flash/lib
-    if "/flash/lib" not in sys.path:
-        sys.path.insert(0, "/flash/lib")
-    if "/flash/apps" not in sys.path:
-        sys.path.insert(0, "/flash/apps")
+    _add_paths(("/flash/lib", "/flash/apps"))
 
 # =============================================================================
 # HARDWARE INITIALIZATION
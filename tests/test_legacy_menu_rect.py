@@ -0,0 +1,63 @@
+"""
+Check which menu parts draw_menu_rect() repaints for a given rectangle.
+
+legacy/main.py is a device script (it talks to M5 hardware as soon as
+it runs), so it can't be imported here. Instead we pull the layout
+constants and _rect_dirty_mask() out of the source with ast and run
+just those - the real code, without the hardware.
+"""
+
+import ast
+import builtins
+from pathlib import Path
+
+import pytest
+
+MAIN = Path(__file__).resolve().parent.parent / "legacy" / "main.py"
+NAMES = {"_MENU_START_Y", "_MENU_ITEM_H", "_VISIBLE_ITEMS", "_ROW_Y", "_INDICATOR_BIT"}
+
+
+@pytest.fixture(scope="module")
+def rect_dirty_mask():
+    tree = ast.parse(MAIN.read_text())
+    nodes = [
+        node
+        for node in tree.body
+        if (
+            isinstance(node, ast.Assign)
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id in NAMES
+        )
+        or (isinstance(node, ast.FunctionDef) and node.name == "_rect_dirty_mask")
+    ]
+    namespace = {"const": lambda value: value}
+    exec(compile(ast.Module(body=nodes, type_ignores=[]), str(MAIN), "exec"), namespace)
+    func = namespace["_rect_dirty_mask"]
+
+    # Fail clearly if the function starts reading a global we didn't copy
+    missing = {
+        name
+        for name in func.__code__.co_names
+        if name not in namespace and not hasattr(builtins, name)
+    }
+    assert not missing, f"_rect_dirty_mask() reads {sorted(missing)}; add them to NAMES"
+    return func
+
+
+# Layout: rows at y 22, 44, 66, 88 (22px tall, x 0-220), ^/v column at
+# x 220-240 over y 22-110. Bits 0-3 = rows, bit 4 = ^/v column.
+@pytest.mark.parametrize(
+    ("rect", "expected"),
+    [
+        ((0, 0, 240, 135), 0b11111),  # Whole screen
+        ((0, 0, 240, 22), 0),  # Title bar only
+        ((0, 125, 240, 10), 0),  # Key hint only
+        ((0, 40, 240, 30), 0b10111),  # Rows 0-2 and the ^/v column
+        ((0, 44, 220, 22), 0b00010),  # Exactly row 1, edges don't bleed
+        ((220, 0, 20, 135), 0b10000),  # ^/v column only
+        ((100, 90, 50, 5), 0b01000),  # Small patch inside row 3
+        ((0, 110, 240, 15), 0),  # Gap between last row and key hint
+    ],
+)
+def test_rect_dirty_mask(rect_dirty_mask, rect, expected):
+    assert rect_dirty_mask(*rect) == expected